@@ -0,0 +1,503 @@
+"""
+Shared helpers for the GitHub issue import scripts.
+Requires: gh CLI tool to be installed and authenticated, or GH_TOKEN set.
+"""
+
+import asyncio
+import csv
+import http.client
+import json
+import operator
+import os
+import re
+import select
+import subprocess
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+REPO_OWNER = "Presstronic"
+REPO_NAME = "recontronic-cli-client"
+
+# CSV columns, in the order rows are handed to the helpers below
+COLUMNS = ("Issue ID", "Type", "Priority", "Title", "Story", "Acceptance Criteria",
+           "Epic", "Estimated Points", "Dependencies", "Labels")
+ID, TYPE, PRIO, TITLE, STORY, AC, EPIC, POINTS, DEPS, LABELS = range(len(COLUMNS))
+
+# Read buffer for the CSV, large enough to take a typical import in one read
+READ_BUFFER = 1 << 20
+
+# Checks applied to every row before anything is sent to GitHub
+ISSUE_ID_PATTERN = re.compile(r"^RECON-\d{3}$")
+PRIORITIES = frozenset({"Critical", "High", "Medium", "Low"})
+
+# Result of parse_labels for an empty Labels field
+NO_LABELS = ()
+
+# Number of createIssue mutations sent per GraphQL request. The issue import
+# API (POST /repos/{owner}/{repo}/import/issues) takes one issue per request
+# plus status polling, so aliased mutations need fewer round trips.
+BATCH_SIZE = 25
+
+# Seconds to wait on a stalled connection before failing its batch
+REQUEST_TIMEOUT = 60
+
+# Maximum number of GraphQL requests in flight at once
+CONCURRENCY = 10
+
+# Retry policy for rate-limited responses (delay doubles on every attempt)
+MAX_RETRIES = 5
+BACKOFF_BASE = 1
+
+# Wait for the rate limit window to reset below this many remaining points
+RATE_LIMIT_FLOOR = 100
+
+BODY_TEMPLATE = (
+    "**Type:** {type}\n"
+    "**Priority:** {priority}\n"
+    "**Epic:** {epic}\n"
+    "**Story Points:** {points}\n"
+    "{deps}"
+    "\n## Story\n\n{story}\n"
+    "\n## Acceptance Criteria\n\n{acceptance}\n"
+)
+
+# One aliased createIssue field per issue in a batch; {0} is the alias
+CREATE_FIELD = "{0}: createIssue(input: ${0}) {{ issue {{ url }} }}"
+
+# One aliased createLabel field per missing label; {0} is the alias
+CREATE_LABEL_FIELD = "{0}: createLabel(input: ${0}) {{ label {{ id name }} }}"
+
+# Color given to labels created by the import
+LABEL_COLOR = "ededed"
+
+RESOLVE_QUERY = """
+query BatchResolveForCreate($owner: String!, $name: String!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    id
+    labels(first: 100, after: $after) {
+      nodes { id name }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+# A problem found in one CSV row; row counts data rows from 1
+ValidationError = namedtuple("ValidationError", "row issue_id message")
+
+EXISTING_ISSUES_QUERY = """
+query ExistingIssues($owner: String!, $name: String!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, after: $after) {
+      nodes { title }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+class RateLimited(Exception):
+    """Raised when GitHub asks the client to slow down."""
+
+    def __init__(self, status, retry_after=None):
+        super().__init__(f"GitHub API returned {status}: rate limited")
+        self.retry_after = retry_after
+
+def gh_token():
+    """Read the API token from the environment or the authenticated gh CLI."""
+    # gh itself prefers these variables, so there is no need to spawn it
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+
+    # gh prints only the token; nothing on stderr is needed beyond the exit status
+    try:
+        result = subprocess.run(["gh", "auth", "token"], stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        raise RuntimeError("could not read a token from gh. Run 'gh auth login' first.")
+    return result.stdout.rstrip()
+
+class GitHubClient:
+    """GitHub GraphQL client that keeps one HTTPS connection per thread."""
+
+    def __init__(self, owner=REPO_OWNER, name=REPO_NAME):
+        # Ask gh for its token once instead of spawning it for every issue
+        token = gh_token()
+        self.owner = owner
+        self.name = name
+        self.headers = {
+            "Authorization": f"bearer {token}",
+            "Content-Type": "application/json",
+            # createLabel is still behind the labels preview
+            "Accept": "application/vnd.github.bane-preview+json",
+            "User-Agent": f"{name}-import-issues",
+        }
+        self.repo_id = None
+        self.label_ids = {}
+        # Rate limit budget as reported by the most recent response
+        self.remaining = None
+        self.reset_at = None
+        self._local = threading.local()
+        # One worker (and so one keep-alive connection) per concurrent request;
+        # the default executor would be sized by CPU count instead
+        self.executor = ThreadPoolExecutor(max_workers=CONCURRENCY,
+                                           thread_name_prefix="gh-import")
+
+    @property
+    def conn(self):
+        """The keep-alive connection owned by the calling thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = http.client.HTTPSConnection("api.github.com",
+                                                                  timeout=REQUEST_TIMEOUT)
+        return conn
+
+    def graphql(self, query, variables=None):
+        """POST a GraphQL document and return the decoded response."""
+        payload = json.dumps({"query": query, "variables": variables or {}})
+        conn = self.conn
+        # A readable idle socket means the server closed the keep-alive
+        # connection; reconnect before sending rather than after
+        if conn.sock is not None and select.select([conn.sock], [], [], 0)[0]:
+            conn.close()
+
+        try:
+            conn.request("POST", "/graphql", body=payload, headers=self.headers)
+        except OSError:
+            # The request never reached GitHub in full, so it is safe to send again
+            conn.close()
+            conn.request("POST", "/graphql", body=payload, headers=self.headers)
+
+        # Once sent, the mutations may have run; never resend them
+        try:
+            response = conn.getresponse()
+            body = response.read()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            raise
+        remaining = response.getheader("X-RateLimit-Remaining")
+        if remaining is not None:
+            self.remaining = int(remaining)
+            self.reset_at = int(response.getheader("X-RateLimit-Reset", "0"))
+        retry_after = response.getheader("Retry-After")
+        # Secondary limits come back as 403 with Retry-After, primary as 403
+        # with no budget left
+        limited = retry_after or self.remaining == 0
+        if response.status == 429 or (response.status == 403 and limited):
+            raise RateLimited(response.status, int(retry_after) if retry_after else None)
+
+        # Gateway errors on heavy batches come back as HTML, so check the
+        # status before decoding
+        try:
+            data = json.loads(body or b"{}")
+        except ValueError:
+            data = None
+        if response.status != 200:
+            message = data.get("message", data) if isinstance(data, dict) else response.reason
+            raise RuntimeError(f"GitHub API returned {response.status}: {message}")
+        if not isinstance(data, dict):
+            raise RuntimeError("GitHub API returned a response that is not JSON")
+        # GraphQL reports exhausted limits as a 200 with RATE_LIMITED errors.
+        # Retry only if nothing ran; once any alias succeeded, resending the
+        # document would duplicate it, so the caller reports per alias instead
+        rate_limited = any(error.get("type") == "RATE_LIMITED"
+                           for error in data.get("errors") or ())
+        if rate_limited and not any((data.get("data") or {}).values()):
+            raise RateLimited(response.status, int(retry_after) if retry_after else None)
+        return data
+
+    def resolve(self):
+        """Look up the repository ID and label IDs, 100 labels per query."""
+        variables = {"owner": self.owner, "name": self.name, "after": None}
+        while True:
+            data = self.graphql(RESOLVE_QUERY, variables)
+            if data.get("errors"):
+                raise RuntimeError(data["errors"][0]["message"])
+
+            repo = data["data"]["repository"]
+            self.repo_id = repo["id"]
+            # Label names are case-insensitive on GitHub
+            self.label_ids.update((node["name"].lower(), node["id"])
+                                  for node in repo["labels"]["nodes"])
+
+            page = repo["labels"]["pageInfo"]
+            if not page["hasNextPage"]:
+                break
+            variables["after"] = page["endCursor"]
+
+    def existing_issue_ids(self):
+        """Return the IDs of issues already in the repository, open or closed.
+
+        Issues are titled "RECON-###: title", so the ID is the part before
+        the first colon.
+        """
+        ids = set()
+        variables = {"owner": self.owner, "name": self.name, "after": None}
+        while True:
+            data = self.graphql(EXISTING_ISSUES_QUERY, variables)
+            if data.get("errors"):
+                raise RuntimeError(data["errors"][0]["message"])
+
+            issues = data["data"]["repository"]["issues"]
+            ids.update(node["title"].split(":", 1)[0].strip() for node in issues["nodes"])
+
+            page = issues["pageInfo"]
+            if not page["hasNextPage"]:
+                return frozenset(ids)
+            variables["after"] = page["endCursor"]
+
+def open_csv(path):
+    """Open an issue CSV for streaming with read_rows."""
+    # newline='' leaves line endings inside quoted fields to the csv module
+    return open(path, 'r', encoding='utf-8', newline='', buffering=READ_BUFFER)
+
+def read_rows(f):
+    """Yield CSV rows as tuples ordered like COLUMNS."""
+    reader = csv.reader(f)
+    header = next(reader, [])
+
+    # Resolve column positions once instead of building a dict per row
+    missing = [name for name in COLUMNS if name not in header]
+    if missing:
+        raise ValueError(f"CSV is missing column(s): {', '.join(missing)}")
+    pick = operator.itemgetter(*[header.index(name) for name in COLUMNS])
+
+    for row in reader:
+        # Blank lines (such as a trailing newline) carry no issue
+        if not row:
+            continue
+        if len(row) != len(header):
+            raise ValueError(f"CSV line {reader.line_num} has {len(row)} columns, "
+                             f"expected {len(header)}")
+        yield pick(row)
+
+def validate_rows(rows):
+    """Check rows locally so a bad CSV fails before any API call.
+
+    Returns a list of ValidationError, empty when every row is valid.
+    """
+    errors = []
+    for n, row in enumerate(rows, start=1):
+        issue_id = row[ID]
+        if not ISSUE_ID_PATTERN.match(issue_id):
+            errors.append(ValidationError(n, issue_id, f"invalid issue ID {issue_id!r}"))
+        if not row[TITLE].strip():
+            errors.append(ValidationError(n, issue_id, "title is empty"))
+        if not row[STORY].strip():
+            errors.append(ValidationError(n, issue_id, "story is empty"))
+        if row[PRIO] not in PRIORITIES:
+            errors.append(ValidationError(n, issue_id, f"unknown priority {row[PRIO]!r}"))
+        if not parse_labels(row[LABELS]):
+            errors.append(ValidationError(n, issue_id, "no labels"))
+    return errors
+
+def parse_labels(label_str):
+    """Parse semicolon-separated labels.
+
+    Empty fields return the shared NO_LABELS tuple instead of a new list.
+    """
+    if not label_str or label_str.isspace():
+        return NO_LABELS
+    return [l for l in (part.strip() for part in label_str.split(';')) if l]
+
+def build_body(row):
+    """Build the Markdown body for an issue row."""
+    deps = row[DEPS]
+    return BODY_TEMPLATE.format(
+        type=row[TYPE], priority=row[PRIO], epic=row[EPIC], points=row[POINTS],
+        deps=f"**Dependencies:** {deps}\n" if deps and deps.strip() else "",
+        story=row[STORY], acceptance=row[AC])
+
+def issue_labels(row):
+    """Return the set of labels for an issue row, adding 'critical' for critical issues."""
+    labels_set = set(parse_labels(row[LABELS]))
+
+    # Add priority as a label; the set already ignores a duplicate
+    if row[PRIO].lower() == "critical":
+        labels_set.add("critical")
+
+    return labels_set
+
+def build_mutation(definitions, fields):
+    """Join variable definitions and aliased fields into one mutation document."""
+    return "".join(("mutation(", ", ".join(definitions), ") {\n  ",
+                    "\n  ".join(fields), "\n}"))
+
+def collect_labels(rows):
+    """Return the set of labels used by rows."""
+    names = set()
+    for row in rows:
+        names.update(issue_labels(row))
+    return names
+
+def ensure_labels(client, names):
+    """Create the labels in names that the repository is missing.
+
+    All missing labels are created with one aliased GraphQL mutation and
+    added to client.label_ids. Returns the number of labels created.
+    """
+    missing = {}
+    for name in sorted(names):
+        if name.lower() not in client.label_ids:
+            missing.setdefault(name.lower(), name)
+    if not missing:
+        return 0
+
+    definitions = []
+    fields = []
+    variables = {}
+    for i, name in enumerate(missing.values()):
+        alias = f"l{i}"
+        definitions.append(f"${alias}: CreateLabelInput!")
+        fields.append(CREATE_LABEL_FIELD.format(alias))
+        variables[alias] = {"repositoryId": client.repo_id, "name": name, "color": LABEL_COLOR}
+
+    response = client.graphql(build_mutation(definitions, fields), variables)
+    for error in response.get("errors") or ():
+        print(f"✗ Failed to create label: {error['message']}")
+
+    created = 0
+    for result in (response.get("data") or {}).values():
+        if result:
+            label = result["label"]
+            client.label_ids[label["name"].lower()] = label["id"]
+            print(f"✓ Created label {label['name']}")
+            created += 1
+    return created
+
+async def graphql_async(client, query, variables):
+    """Run client.graphql on the client's worker pool, backing off when rate limited."""
+    for attempt in range(MAX_RETRIES + 1):
+        # Spend the last of the budget only after the window resets
+        if client.remaining is not None and client.remaining < RATE_LIMIT_FLOOR:
+            await asyncio.sleep(max(0, client.reset_at - time.time()))
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                client.executor, client.graphql, query, variables)
+        except RateLimited as e:
+            if attempt == MAX_RETRIES:
+                raise
+            delay = e.retry_after if e.retry_after is not None else BACKOFF_BASE * 2 ** attempt
+            await asyncio.sleep(delay)
+
+async def create_issues(client, rows):
+    """Create a batch of GitHub issues with one aliased GraphQL mutation.
+
+    Progress for the whole batch is written to stdout in one call. Returns
+    the number of issues created.
+    """
+    out = []
+    try:
+        definitions = []
+        fields = []
+        variables = {}
+        pending = {}
+
+        for row in rows:
+            title = f"{row[ID]}: {row[TITLE]}"
+            labels_set = issue_labels(row)
+            missing = [l for l in labels_set if l.lower() not in client.label_ids]
+            if missing:
+                out.append(f"✗ Failed to create {title}\n"
+                           f"  Error: label(s) not found: {', '.join(missing)}\n")
+                continue
+
+            alias = f"i{len(pending)}"
+            definitions.append(f"${alias}: CreateIssueInput!")
+            fields.append(CREATE_FIELD.format(alias))
+            variables[alias] = {
+                "repositoryId": client.repo_id,
+                "title": title,
+                "body": build_body(row),
+                "labelIds": [client.label_ids[l.lower()] for l in labels_set],
+            }
+            pending[alias] = title
+
+        if not pending:
+            return 0
+
+        doc = build_mutation(definitions, fields)
+        try:
+            response = await graphql_async(client, doc, variables)
+        except (RateLimited, RuntimeError, OSError, http.client.HTTPException) as e:
+            for title in pending.values():
+                out.append(f"✗ Failed to create {title}\n  Error: {e}\n")
+            return 0
+
+        # Mutations in a batch succeed or fail independently
+        errors = {}
+        for error in response.get("errors") or ():
+            path = error.get("path") or [None]
+            errors.setdefault(path[0], error["message"])
+
+        data = response.get("data") or {}
+        created = 0
+        for alias, title in pending.items():
+            result = data.get(alias)
+            if result:
+                created += 1
+                out.append(f"✓ Created {title}\n  URL: {result['issue']['url']}\n")
+            else:
+                message = errors.get(alias) or errors.get(None, "unknown error")
+                out.append(f"✗ Failed to create {title}\n  Error: {message}\n")
+        return created
+    finally:
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+
+async def run_batch(client, rows, skip=frozenset()):
+    """Create issues for rows whose ID is not in skip.
+
+    A producer groups rows into batches on a bounded queue while CONCURRENCY
+    consumers upload them, so reading the CSV overlaps with network I/O and
+    only a few batches are held in memory. Rows are ordered by labels within
+    each batch rather than across the whole file for the same reason.
+    Returns (created, failed, skipped) counts.
+    """
+    queue = asyncio.Queue(maxsize=CONCURRENCY)
+
+    def by_labels(row):
+        # Compare label sets, so "api;rest" and "rest;api" group together
+        return ";".join(sorted(issue_labels(row))), row[PRIO]
+
+    async def put(batch):
+        # Keep issues with the same labels together; the sort is stable, so
+        # CSV order is kept among them
+        batch.sort(key=by_labels)
+        await queue.put(batch)
+
+    async def producer():
+        skipped = 0
+        batch = []
+        for row in rows:
+            if row[ID] in skip:
+                skipped += 1
+                continue
+            batch.append(row)
+            if len(batch) == BATCH_SIZE:
+                await put(batch)
+                batch = []
+        if batch:
+            await put(batch)
+
+        # One sentinel per consumer
+        for _ in range(CONCURRENCY):
+            await queue.put(None)
+        return skipped
+
+    async def consumer():
+        created = attempted = 0
+        while (batch := await queue.get()) is not None:
+            created += await create_issues(client, batch)
+            attempted += len(batch)
+        return created, attempted
+
+    skipped, *results = await asyncio.gather(producer(), *[consumer() for _ in range(CONCURRENCY)])
+    created = sum(c for c, _ in results)
+    attempted = sum(a for _, a in results)
+    return created, attempted - created, skipped
@@ -1,102 +1,48 @@
 #!/usr/bin/env python3
 """
 Import issues from mvp-issues.csv to GitHub Issues.
-Requires: gh CLI tool to be installed and authenticated.
+Issues whose ID is already used by an issue in the repository are skipped,
+so the import can simply be re-run after a partial failure.
+Requires: gh CLI tool to be installed and authenticated, or GH_TOKEN set.
 """
 
-import csv
-import subprocess
+import argparse
+import asyncio
 import sys
-import json
 
-def parse_labels(label_str):
-    """Parse semicolon-separated labels."""
-    if not label_str or label_str.strip() == "":
-        return []
-    return [l.strip() for l in label_str.split(';') if l.strip()]
-
-def create_issue(issue_id, issue_type, priority, title, story, acceptance_criteria,
-                 epic, points, dependencies, labels):
-    """Create a GitHub issue using gh CLI."""
-
-    # Build issue body
-    body = f"**Type:** {issue_type}\n"
-    body += f"**Priority:** {priority}\n"
-    body += f"**Epic:** {epic}\n"
-    body += f"**Story Points:** {points}\n"
-    if dependencies and dependencies.strip():
-        body += f"**Dependencies:** {dependencies}\n"
-    body += f"\n## Story\n\n{story}\n"
-    body += f"\n## Acceptance Criteria\n\n{acceptance_criteria}\n"
-
-    # Parse labels
-    label_list = parse_labels(labels)
-
-    # Add priority as a label if it doesn't exist
-    priority_lower = priority.lower()
-    if priority_lower == "critical" and "critical" not in label_list:
-        label_list.append("critical")
-
-    # Build gh command
-    cmd = [
-        "gh", "issue", "create",
-        "--repo", "Presstronic/recontronic-cli-client",
-        "--title", f"{issue_id}: {title}",
-        "--body", body
-    ]
-
-    # Add labels
-    if label_list:
-        for label in label_list:
-            cmd.extend(["--label", label])
-
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        issue_url = result.stdout.strip()
-        print(f"✓ Created {issue_id}: {title}")
-        print(f"  URL: {issue_url}")
-        return issue_url
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Failed to create {issue_id}: {title}")
-        print(f"  Error: {e.stderr}")
-        return None
+from _gh_import import (REPO_NAME, REPO_OWNER, GitHubClient, collect_labels,
+                        ensure_labels, open_csv, read_rows, run_batch, validate_rows)
 
 def main():
-    csv_file = "mvp-issues.csv"
+    parser = argparse.ArgumentParser(description="Import issues from a CSV file to GitHub Issues.")
+    parser.add_argument("csv_file", nargs="?", default="mvp-issues.csv",
+                        help="issue CSV to import (default: %(default)s)")
+    csv_file = parser.parse_args().csv_file
 
     print(f"Importing issues from {csv_file}...")
-    print(f"Repository: Presstronic/recontronic-cli-client\n")
-
-    created_count = 0
-    failed_count = 0
+    print(f"Repository: {REPO_OWNER}/{REPO_NAME}\n")
 
     try:
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                issue_id = row['Issue ID']
-                issue_type = row['Type']
-                priority = row['Priority']
-                title = row['Title']
-                story = row['Story']
-                acceptance = row['Acceptance Criteria']
-                epic = row['Epic']
-                points = row['Estimated Points']
-                deps = row['Dependencies']
-                labels = row['Labels']
-
-                result = create_issue(issue_id, issue_type, priority, title,
-                                    story, acceptance, epic, points, deps, labels)
-
-                if result:
-                    created_count += 1
-                else:
-                    failed_count += 1
-
-                # Small delay to avoid rate limiting
-                import time
-                time.sleep(0.5)
+        with open_csv(csv_file) as f:
+            # Check every row before touching the network
+            errors = validate_rows(read_rows(f))
+            if errors:
+                print(f"Error: {csv_file} has {len(errors)} problem(s), nothing was imported:")
+                for error in errors:
+                    print(f"  row {error.row} ({error.issue_id}): {error.message}")
+                sys.exit(1)
+            f.seek(0)
+
+            client = GitHubClient()
+            client.resolve()
+            existing = client.existing_issue_ids()
+            print(f"Found {len(existing)} existing issues\n")
+
+            # Create every missing label up front, then rewind for the upload
+            ensure_labels(client, collect_labels(read_rows(f)))
+            f.seek(0)
+            created_count, failed_count, skipped_count = asyncio.run(
+                run_batch(client, read_rows(f), skip=existing))
 
     except FileNotFoundError:
         print(f"Error: {csv_file} not found!")
@@ -109,6 +55,7 @@ def main():
     print(f"\n{'='*60}")
     print(f"Import complete!")
     print(f"  Created: {created_count} issues")
+    print(f"  Skipped: {skipped_count} issues (already created)")
     print(f"  Failed:  {failed_count} issues")
     print(f"{'='*60}")
 